@@ -16,14 +16,15 @@ def setup(set_prefix=True):
     from django.apps import apps
     from django.conf import settings
     from django.urls import set_script_prefix
-    from django.utils.encoding import force_text
     from django.utils.log import configure_logging
 
     configure_logging(settings.LOGGING_CONFIG, settings.LOGGING)
     if set_prefix:
-        set_script_prefix(
-            '/' if settings.FORCE_SCRIPT_NAME is None else force_text(settings.FORCE_SCRIPT_NAME)
-        )
+        if settings.FORCE_SCRIPT_NAME is None:
+            set_script_prefix('/')
+        else:
+            from django.utils.encoding import force_text
+            set_script_prefix(force_text(settings.FORCE_SCRIPT_NAME))
     # 加载settings.INSTALLED_APPS中的应用程序配置和模型
     # 1. 创建AppConfig对象
     # 2. 将AppConfig对象添加到apps.app_configs中
@@ -3,8 +3,15 @@ Invokes(援用) django-admin when the django module is run as a script.
 
 Example: python -m django check
 """
-from django.core import management
+import sys
 
 if __name__ == "__main__":
-    # 执行命令行
-    management.execute_from_command_line()
+    if sys.argv[1:] == ['--version']:
+        # Answer 'python -m django --version' without importing the
+        # management machinery (and, through it, the settings).
+        import django
+        sys.stdout.write(django.get_version() + '\n')
+    else:
+        from django.core import management
+        # 执行命令行
+        management.execute_from_command_line()
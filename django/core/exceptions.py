@@ -1,8 +1,18 @@
 """
 Global Django exception and warning classes.
 """
-from django.utils import six
-from django.utils.encoding import force_text
+import sys
+from itertools import chain
+
+# django.core.exceptions is imported very early (by django.conf), so it keeps
+# its own imports down to the standard library. The attribute used by
+# ValidationError.__init__ to recognize a single error is resolved once here
+# rather than on every instantiation; see the comment there for why it
+# differs on PY2.
+_SINGLE_ERROR_ATTR = 'message' if sys.version_info[0] == 3 else 'code'
+# django.utils.encoding.force_text, imported on first use by
+# ValidationError._format_messages().
+_force_text = None
 
 
 class FieldDoesNotExist(Exception):
@@ -155,6 +165,13 @@ class ValidationError(Exception):
     用途：当数据验证失败时抛出
     使用场景：用户提交了无效的数据，导致无法正常使用
     """
+    # Whether this instance carries an `error_dict`. Checking this flag is
+    # cheaper than probing with hasattr(), which raises and swallows an
+    # AttributeError whenever the attribute is missing.
+    _is_dict = False
+    # Backing store for `error_list`; see the property below.
+    _error_list = None
+
     def __init__(self, message, code=None, params=None):
         """
         The `message` argument can be a single error, a list of errors, or a
@@ -170,18 +187,27 @@ class ValidationError(Exception):
         # self.error_dict = {}    # 字段级错误：{'field': [errors]}
         # self.error_list = []    # 错误列表：[error1, error2]
         # self.message = message  # 单个错误消息
+        if not isinstance(message, (ValidationError, dict, list)):
+            # Fast path for the most common case: a single error message.
+            # error_list is only built if something asks for it.
+            self.message = message
+            self.code = code
+            self.params = params
+            return
+
         if isinstance(message, ValidationError):
-            if hasattr(message, 'error_dict'):
+            if message._is_dict:
                 message = message.error_dict
             # PY2 has a `message` property which is always there so we can't
             # duck-type on it. It was introduced in Python 2.5 and already
             # deprecated in Python 2.6.
-            elif not hasattr(message, 'message' if six.PY3 else 'code'):
+            elif not hasattr(message, _SINGLE_ERROR_ATTR):
                 message = message.error_list
             else:
                 message, code, params = message.message, message.code, message.params
 
         if isinstance(message, dict):
+            self._is_dict = True
             self.error_dict = {}
             for field, messages in message.items():
                 if not isinstance(messages, ValidationError):
@@ -189,58 +215,97 @@ class ValidationError(Exception):
                 self.error_dict[field] = messages.error_list
 
         elif isinstance(message, list):
-            self.error_list = []
+            self.error_list = error_list = []
             for message in message:
                 # Normalize plain strings to instances of ValidationError.
                 if not isinstance(message, ValidationError):
                     message = ValidationError(message)
-                if hasattr(message, 'error_dict'):
-                    self.error_list.extend(sum(message.error_dict.values(), []))
+                if message._is_dict:
+                    error_list.extend(chain.from_iterable(message.error_dict.values()))
                 else:
-                    self.error_list.extend(message.error_list)
+                    error_list.extend(message.error_list)
 
         else:
             self.message = message
             self.code = code
             self.params = params
-            self.error_list = [self]
+
+    @property
+    def error_list(self):
+        """
+        The list of single errors. For a single error it's `[self]`, created
+        on first access. It doesn't exist on an error that carries an
+        `error_dict`.
+        """
+        error_list = self._error_list
+        if error_list is None:
+            if self._is_dict:
+                raise AttributeError("'ValidationError' object has no attribute 'error_list'")
+            self._error_list = error_list = [self]
+        return error_list
+
+    @error_list.setter
+    def error_list(self, value):
+        self._error_list = value
 
     @property
     def message_dict(self):
         # Trigger an AttributeError if this ValidationError
         # doesn't have an error_dict.
-        getattr(self, 'error_dict')
-
-        return dict(self)
+        return {
+            field: self._format_messages(errors)
+            for field, errors in self.error_dict.items()
+        }
 
     @property
     def messages(self):
-        if hasattr(self, 'error_dict'):
-            # 扁平化，sum(iterable, [])，有点黑科技那味了
-            return sum(dict(self).values(), [])
-        return list(self)
+        if self._is_dict:
+            # 扁平化，chain.from_iterable 是线性的，sum(iterable, []) 是平方级的
+            return self._format_messages(chain.from_iterable(self.error_dict.values()))
+        return self._format_messages(self.error_list)
 
     def update_error_dict(self, error_dict):
-        if hasattr(self, 'error_dict'):
+        # Unlike setdefault(field, []), this doesn't allocate a throwaway list
+        # when the field already has errors.
+        if self._is_dict:
             for field, error_list in self.error_dict.items():
-                error_dict.setdefault(field, []).extend(error_list)
+                existing = error_dict.get(field)
+                if existing is None:
+                    error_dict[field] = list(error_list)
+                else:
+                    existing.extend(error_list)
         else:
-            error_dict.setdefault(NON_FIELD_ERRORS, []).extend(self.error_list)
+            existing = error_dict.get(NON_FIELD_ERRORS)
+            if existing is None:
+                error_dict[NON_FIELD_ERRORS] = list(self.error_list)
+            else:
+                existing.extend(self.error_list)
         return error_dict
 
+    @staticmethod
+    def _format_messages(error_list):
+        """
+        Return the messages of the single errors in `error_list`, with their
+        params interpolated, as text.
+        """
+        global _force_text
+        if _force_text is None:
+            from django.utils.encoding import force_text as _force_text
+        return [
+            _force_text(error.message % error.params if error.params else error.message)
+            for error in error_list
+        ]
+
     def __iter__(self):
-        if hasattr(self, 'error_dict'):
+        if self._is_dict:
             for field, errors in self.error_dict.items():
-                yield field, list(ValidationError(errors))
+                yield field, self._format_messages(errors)
         else:
-            for error in self.error_list:
-                message = error.message
-                if error.params:
-                    message %= error.params
-                yield force_text(message)
+            for message in self._format_messages(self.error_list):
+                yield message
 
     def __str__(self):
-        if hasattr(self, 'error_dict'):
+        if self._is_dict:
             return repr(dict(self))
         return repr(list(self))
 
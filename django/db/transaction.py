@@ -1,7 +1,9 @@
+from functools import wraps
+
 from django.db import (
     DEFAULT_DB_ALIAS, DatabaseError, Error, ProgrammingError, connections,
 )
-from django.utils.decorators import ContextDecorator
+from django.utils.decorators import ContextDecorator, available_attrs
 
 
 class TransactionManagementError(ProgrammingError):
@@ -16,9 +18,7 @@ def get_connection(using=None):
     Get a database connection by name, or the default database connection
     if no name is provided. This is a private API.
     """
-    if using is None:
-        using = DEFAULT_DB_ALIAS
-    return connections[using]
+    return connections[DEFAULT_DB_ALIAS if using is None else using]
 
 
 def get_autocommit(using=None):
@@ -164,15 +164,26 @@ class Atomic(ContextDecorator):
 
     This is a private API.
     """
+    __slots__ = ('using', 'savepoint')
 
     def __init__(self, using, savepoint):
         self.using = using
         self.savepoint = savepoint
 
+    def __call__(self, func):
+        # Wrap func directly rather than through ContextDecorator.__call__,
+        # which goes through _recreate_cm() on every call on Python 3.
+        @wraps(func, assigned=available_attrs(func))
+        def inner(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return inner
+
     def __enter__(self):
         connection = get_connection(self.using)
+        in_atomic_block = connection.in_atomic_block
 
-        if not connection.in_atomic_block:
+        if not in_atomic_block:
             # Reset state when entering an outermost atomic block.
             # 当进入最外层的atomic块时，重置状态。
             connection.commit_on_exit = True
@@ -189,10 +200,10 @@ class Atomic(ContextDecorator):
                 # Pretend we're already in an atomic block to bypass the code
                 # that disables autocommit to enter a transaction, and make a
                 # note to deal with this case in __exit__.
-                connection.in_atomic_block = True
+                connection.in_atomic_block = in_atomic_block = True
                 connection.commit_on_exit = False
 
-        if connection.in_atomic_block:
+        if in_atomic_block:
             # We're already in a transaction; create a savepoint, unless we
             # were told not to or we're already waiting for a rollback. The
             # second condition avoids creating useless savepoints and prevents
@@ -210,13 +221,20 @@ class Atomic(ContextDecorator):
 
     def __exit__(self, exc_type, exc_value, traceback):
         connection = get_connection(self.using)
-
-        if connection.savepoint_ids:
-            sid = connection.savepoint_ids.pop()
+        savepoint_ids = connection.savepoint_ids
+
+        if savepoint_ids:
+            sid = savepoint_ids.pop()
+            # Only read in the finally clause while in_atomic_block is still
+            # True. A connect() during commit or rollback replaces
+            # savepoint_ids, but it also clears in_atomic_block, so this
+            # value must not be relied on once in_atomic_block is False.
+            has_savepoints = bool(savepoint_ids)
         else:
             # Prematurely unset this flag to allow using commit or rollback.
             # 过早的取消这个标志以允许提交或回滚
             connection.in_atomic_block = False
+            has_savepoints = False
 
         try:
             if connection.closed_in_transaction:
@@ -233,29 +251,14 @@ class Atomic(ContextDecorator):
                         try:
                             connection.savepoint_commit(sid)
                         except DatabaseError:
-                            try:
-                                connection.savepoint_rollback(sid)
-                                # The savepoint won't be reused. Release it to
-                                # minimize overhead for the database server.
-                                # 这个保存点不会被使用，释放它来尽量减少数据库服务器的开销
-                                connection.savepoint_commit(sid)
-                            except Error:
-                                # If rolling back to a savepoint fails, mark for
-                                # rollback at a higher level and avoid shadowing
-                                # the original exception.
-                                connection.needs_rollback = True
+                            self._rollback_to_savepoint(connection, sid)
                             raise
                 else:
                     # Commit transaction
                     try:
                         connection.commit()
                     except DatabaseError:
-                        try:
-                            connection.rollback()
-                        except Error:
-                            # An error during rollback means that something
-                            # went wrong with the connection. Drop it.
-                            connection.close()
+                        self._rollback_transaction(connection)
                         raise
             else:
                 # This flag will be set to True again if there isn't a savepoint
@@ -269,41 +272,52 @@ class Atomic(ContextDecorator):
                     if sid is None:
                         connection.needs_rollback = True
                     else:
-                        try:
-                            connection.savepoint_rollback(sid)
-                            # The savepoint won't be reused. Release it to
-                            # minimize overhead for the database server.
-                            connection.savepoint_commit(sid)
-                        except Error:
-                            # If rolling back to a savepoint fails, mark for
-                            # rollback at a higher level and avoid shadowing
-                            # the original exception.
-                            connection.needs_rollback = True
+                        self._rollback_to_savepoint(connection, sid)
                 else:
                     # Roll back transaction
-                    try:
-                        connection.rollback()
-                    except Error:
-                        # An error during rollback means that something
-                        # went wrong with the connection. Drop it.
-                        connection.close()
+                    self._rollback_transaction(connection)
 
         finally:
-            # Outermost block exit when autocommit was enabled.
-            # 最外层的块退出时，autocommit为真。
-            if not connection.in_atomic_block:
+            in_atomic_block = connection.in_atomic_block
+            # Outermost block exit, either when autocommit was enabled
+            # (in_atomic_block was unset above) or when it was disabled.
+            # 最外层的块退出时，autocommit为真（上面已取消in_atomic_block）或为假。
+            if not in_atomic_block or (not has_savepoints and not connection.commit_on_exit):
                 if connection.closed_in_transaction:
                     connection.connection = None
-                else:
+                elif not in_atomic_block:
                     connection.set_autocommit(True)
-            # Outermost block exit when autocommit was disabled.
-            # 最外层的块退出时，autocommit为假。
-            elif not connection.savepoint_ids and not connection.commit_on_exit:
-                if connection.closed_in_transaction:
-                    connection.connection = None
                 else:
                     connection.in_atomic_block = False
 
+    @staticmethod
+    def _rollback_to_savepoint(connection, sid):
+        try:
+            connection.savepoint_rollback(sid)
+            # The savepoint won't be reused. Release it to
+            # minimize overhead for the database server.
+            # 这个保存点不会被使用，释放它来尽量减少数据库服务器的开销
+            connection.savepoint_commit(sid)
+        except Error:
+            # If rolling back to a savepoint fails, mark for
+            # rollback at a higher level and avoid shadowing
+            # the original exception.
+            connection.needs_rollback = True
+
+    @staticmethod
+    def _rollback_transaction(connection):
+        try:
+            connection.rollback()
+        except Error:
+            # An error during rollback means that something
+            # went wrong with the connection. Drop it.
+            connection.close()
+
+
+# Atomic instances are stateless -- everything they track lives on the
+# thread-local connection -- so the default configuration can be shared.
+_default_atomic = Atomic(DEFAULT_DB_ALIAS, True)
+
 
 def atomic(using=None, savepoint=True):
     # Bare decorator: @atomic -- although the first argument is called
@@ -311,6 +325,8 @@ def atomic(using=None, savepoint=True):
     if callable(using):
         return Atomic(DEFAULT_DB_ALIAS, savepoint)(using)
     # Decorator: @atomic(...) or context manager: with atomic(...): ...
+    elif using is None and savepoint is True:
+        return _default_atomic
     else:
         return Atomic(using, savepoint)
 
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from django.core.exceptions import ValidationError
@@ -14,3 +16,52 @@ class TestValidationError(unittest.TestCase):
         message_dict['field2'] = ['E3', 'E4']
         exception = ValidationError(message_dict)
         self.assertEqual(sorted(exception.messages), ['E1', 'E2', 'E3', 'E4'])
+
+    def test_error_dict_only_set_for_dict_errors(self):
+        self.assertFalse(hasattr(ValidationError('E1'), 'error_dict'))
+        self.assertFalse(hasattr(ValidationError(['E1', 'E2']), 'error_dict'))
+        exception = ValidationError({'field1': ['E1']})
+        self.assertEqual(exception.message_dict, {'field1': ['E1']})
+        self.assertEqual(ValidationError(exception).message_dict, {'field1': ['E1']})
+        self.assertEqual(ValidationError([exception, 'E2']).messages, ['E1', 'E2'])
+
+    def test_error_list(self):
+        exception = ValidationError('E1')
+        self.assertEqual(exception.error_list, [exception])
+        self.assertIs(exception.error_list, exception.error_list)
+        self.assertEqual(ValidationError(['E1', 'E2']).messages, ['E1', 'E2'])
+        self.assertFalse(hasattr(ValidationError({'field1': ['E1']}), 'error_list'))
+
+    def test_error_list_mutation(self):
+        exception = ValidationError('E1')
+        exception.error_list.append(ValidationError('E2'))
+        self.assertEqual(len(exception.error_list), 2)
+        self.assertEqual(exception.messages, ['E1', 'E2'])
+
+    def test_error_list_pickle(self):
+        exception = ValidationError('E1', code='c')
+        unpickled = pickle.loads(pickle.dumps(exception))
+        self.assertEqual(unpickled.error_list[0].message, 'E1')
+        self.assertIs(unpickled.error_list[0], unpickled)
+        self.assertEqual(exception.error_list, [exception])
+        unpickled = pickle.loads(pickle.dumps(exception))
+        self.assertIs(unpickled.error_list[0], unpickled)
+        self.assertEqual(unpickled.messages, ['E1'])
+
+    def test_copy(self):
+        single = ValidationError('E1')
+        list_error = ValidationError(['E1', 'E2'])
+        dict_error = ValidationError({'field1': ['E1'], 'field2': ['E2']})
+        for copy_func in (copy.copy, copy.deepcopy):
+            with self.subTest(copy_func=copy_func):
+                copied = copy_func(single)
+                self.assertEqual(copied.messages, ['E1'])
+                self.assertIs(copied.error_list[0], copied)
+                self.assertEqual(copy_func(list_error).messages, ['E1', 'E2'])
+                copied = copy_func(dict_error)
+                self.assertEqual(copied.message_dict, {'field1': ['E1'], 'field2': ['E2']})
+                self.assertFalse(hasattr(copied, 'error_list'))
+        # Once error_list has been built, deepcopy keeps it self-referencing.
+        self.assertEqual(single.error_list, [single])
+        copied = copy.deepcopy(single)
+        self.assertIs(copied.error_list[0], copied)